@@ -1,5 +1,6 @@
+import os
 import sys
-import subprocess
+import asyncio
 import traceback
 import click
 from typing import Optional
@@ -7,6 +8,19 @@ from claudecli.logger import setup_logging
 from claudecli.core import ClaudeCLI, ShellConfig
 
 
+async def _generate_and_check(cli: ClaudeCLI, logger, description: str, check_safety: bool):
+    """Generate the command, overlapping the safety check with its display"""
+    command = await cli.aget_command(description)
+    safety_task = asyncio.create_task(cli.ashould_proceed(command)) if check_safety else None
+
+    # Show the command while the safety request is still in flight
+    logger.debug("Generated command:\n")
+    logger.info(command)
+
+    safety_level = await safety_task if safety_task is not None else "PROCEED"
+    return command, safety_level
+
+
 @click.command()
 @click.argument("command_description")
 @click.option("--no-confirm", "-nc", is_flag=True, default=False, help="Execute without confirmation")
@@ -22,23 +36,19 @@ def main(command_description: str, no_confirm: bool, api_key: str, shell: Option
         # Configure shell
         if shell:
             shell_config = ShellConfig(shell, f"/bin/{shell}", f".{shell}rc")
-            logger.debug(f"Using specified shell: {shell}")
+            logger.debug("Using specified shell: %s", shell)
         else:
             shell_config = ShellConfig.detect_current_shell()
-            logger.debug(f"Detected shell: {shell_config.name} ({shell_config.path})")
+            logger.debug("Detected shell: %s (%s)", shell_config.name, shell_config.path)
 
         cli = ClaudeCLI(api_key=api_key, shell=shell_config)
 
-        with click.progressbar(length=1, label="Generating command") as bar:
-            shell_command = cli.get_command(command_description)
-            bar.update(1)
-
-        logger.debug("Generated command:\n")
-        logger.info(shell_command)
+        logger.info("Generating command...")
+        shell_command, safety_level = asyncio.run(
+            _generate_and_check(cli, logger, command_description, check_safety=not no_confirm)
+        )
 
         if not no_confirm:
-            logger.debug("Checking safety level...")
-            safety_level = cli.should_proceed(shell_command)
             if safety_level == "STOP":
                 logger.critical("This command requires careful review!")
                 logger.error("It might be destructive or have unintended consequences.")
@@ -55,27 +65,20 @@ def main(command_description: str, no_confirm: bool, api_key: str, shell: Option
             else:  # PROCEED
                 logger.debug("Command looks safe!")
                 if debug:
-                    logger.debug(f"Safety level: {safety_level}")
+                    logger.debug("Safety level: %s", safety_level)
 
         logger.debug("Executing command...")
 
-        # Use the detected/specified shell
-        process = subprocess.run([shell_config.path, "-c", shell_command], text=True, capture_output=True)
-
-        if process.stdout:
-            click.echo(process.stdout)
-        if process.stderr:
-            click.echo(process.stderr, err=True)
-
-        if process.returncode == 0:
-            logger.debug("Command completed successfully!")
-        else:
-            logger.error(f"Command failed with error code: {process.returncode}")
-
-        sys.exit(process.returncode)
+        # Replace this process with the shell: the command's stdout/stderr go
+        # straight to the terminal (correct TTY behavior for interactive
+        # commands) and the Python interpreter stops occupying memory while
+        # the command runs. exec never returns, so flush buffered logs first.
+        for handler in logger.handlers:
+            handler.flush()
+        os.execvp(shell_config.path, [shell_config.path, "-c", shell_command])
 
     except Exception as e:
-        logger.exception(f"Error:\n{str(e)}")
+        logger.exception("Error:\n%s", e)
         logger.error(traceback.format_exc())
         sys.exit(1)
 
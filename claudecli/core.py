@@ -1,11 +1,59 @@
 import os
+import json
+import hashlib
 import logging
-from typing import Optional
+import functools
+from pathlib import Path
+from typing import Optional, TYPE_CHECKING
 from dataclasses import dataclass
-from anthropic import Anthropic
 
+if TYPE_CHECKING:
+    from anthropic import AsyncAnthropic
 
-@dataclass
+logger = logging.getLogger("claude-cli")
+
+_COMMAND_MODEL = "claude-3-sonnet-20240229"
+_SAFETY_MODEL = "claude-3-haiku-20240307"
+
+# Prompt templates are constant apart from the shell name and the
+# description/command under review, so build the bulk once at import time
+_GET_COMMAND_PROMPT = """Given this request: "{description}"
+        Target shell: {shell}
+
+        Generate ONLY the exact shell command(s) to accomplish this.
+        Use shell-specific syntax and features when beneficial.
+        No explanations or markdown formatting - just the raw command(s).
+        If multiple commands are needed, join them with && or ;
+        Ensure the command is safe and won't cause data loss."""
+
+_SAFETY_PROMPT = """As a {shell} command safety checker, analyze this command and respond with EXACTLY one word:
+        Command: {command}
+
+        If the command appears safe and reasonable, respond with "PROCEED".
+        If the command looks dangerous, unusual, or potentially destructive, respond with "CONFIRM".
+        If the command could be catastrophic or requires human review, respond with "STOP".
+
+        One word response:"""
+
+def _message_text(message) -> str:
+    """Extract the text of a response's first content block
+
+    Message.content is a list of content blocks, not a string; touch only
+    the first block's text rather than walking the whole pydantic object.
+    """
+    return message.content[0].text if message.content else ""
+
+
+# rc file per supported shell; anything else falls back to plain sh
+_SHELL_RC_FILES = {
+    "bash": ".bashrc",
+    "zsh": ".zshrc",
+    "fish": ".config/fish/config.fish",
+    # Add more shells as needed
+}
+
+
+@dataclass(slots=True, frozen=True)
 class ShellConfig:
     """Shell configuration and detection"""
 
@@ -14,19 +62,57 @@ class ShellConfig:
     rc_file: str
 
     @classmethod
+    @functools.lru_cache(maxsize=1)
     def detect_current_shell(cls) -> "ShellConfig":
-        """Detect the current shell environment"""
+        """Detect the current shell environment (cached after the first call)"""
         shell_path = os.environ.get("SHELL", "")
         shell_name = os.path.basename(shell_path)
 
-        shell_configs = {
-            "bash": cls("bash", shell_path, ".bashrc"),
-            "zsh": cls("zsh", shell_path, ".zshrc"),
-            "fish": cls("fish", shell_path, ".config/fish/config.fish"),
-            # Add more shells as needed
-        }
+        rc_file = _SHELL_RC_FILES.get(shell_name)
+        if rc_file is None:
+            return cls("sh", "/bin/sh", "")  # Default to sh
+        return cls(shell_name, shell_path, rc_file)
+
 
-        return shell_configs.get(shell_name, cls("sh", "/bin/sh", ""))  # Default to sh
+class _ResponseCache:
+    """Persistent cache for deterministic (temperature=0) completions
+
+    Both API calls are deterministic given (model, shell, prompt), so repeat
+    requests can skip the network round trip entirely. Entries live in a JSON
+    file under the user's cache directory; a missing or corrupt file just
+    means an empty cache.
+    """
+
+    def __init__(self, path: Optional[Path] = None):
+        if path is None:
+            cache_root = Path(os.environ.get("XDG_CACHE_HOME", Path.home() / ".cache"))
+            path = cache_root / "claude-cli" / "commands.json"
+        self.path = path
+        self._entries: Optional[dict] = None
+
+    @staticmethod
+    def key(model: str, shell: str, prompt: str) -> str:
+        return hashlib.sha1(f"{model}|{shell}|{prompt}".encode()).hexdigest()
+
+    def _load(self) -> dict:
+        if self._entries is None:
+            try:
+                self._entries = json.loads(self.path.read_text())
+            except (OSError, ValueError):
+                self._entries = {}
+        return self._entries
+
+    def get(self, key: str) -> Optional[str]:
+        return self._load().get(key)
+
+    def set(self, key: str, value: str):
+        entries = self._load()
+        entries[key] = value
+        try:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            self.path.write_text(json.dumps(entries))
+        except OSError:
+            pass  # Caching is best-effort; never fail the actual command
 
 
 class ClaudeCLI:
@@ -35,46 +121,108 @@ class ClaudeCLI:
             raise ValueError(
                 "ANTHROPIC_API_KEY is required to use ClaudeCLI. Please obtain an API key from: https://console.anthropic.com/settings/keys"
             )
+        # Imported here rather than at module level: the SDK pulls in httpx,
+        # pydantic etc. and dominates cold start for paths like --help
+        from anthropic import Anthropic
+
+        self._api_key = api_key
         self.client = Anthropic(api_key=api_key)
+        self._async_client: Optional["AsyncAnthropic"] = None
         self.shell = shell or ShellConfig.detect_current_shell()
-        self.logger = logging.getLogger("claude-cli")
+        self.logger = logger
+        self._cache = _ResponseCache()
+        # The shell name never changes for an instance; pre-fill it so each
+        # call is a single %s interpolation of the varying field
+        self._command_prompt = _GET_COMMAND_PROMPT.format(shell=self.shell.name, description="%s")
+        self._safety_prompt = _SAFETY_PROMPT.format(shell=self.shell.name, command="%s")
+
+    @property
+    def async_client(self) -> "AsyncAnthropic":
+        """Async Anthropic client, created on first use"""
+        if self._async_client is None:
+            from anthropic import AsyncAnthropic
+
+            self._async_client = AsyncAnthropic(api_key=self._api_key)
+        return self._async_client
 
     def get_command(self, description: str) -> str:
         """Generate shell command using Claude"""
-        prompt = f"""Given this request: "{description}"
-        Target shell: {self.shell.name}
-        
-        Generate ONLY the exact shell command(s) to accomplish this. 
-        Use shell-specific syntax and features when beneficial.
-        No explanations or markdown formatting - just the raw command(s).
-        If multiple commands are needed, join them with && or ;
-        Ensure the command is safe and won't cause data loss."""
+        prompt = self._command_prompt % description
+
+        cache_key = _ResponseCache.key(_COMMAND_MODEL, self.shell.name, prompt)
+        cached = self._cache.get(cache_key)
+        if cached is not None:
+            return cached
 
         message = self.client.messages.create(
-            model="claude-3-sonnet-20240229",
+            model=_COMMAND_MODEL,
+            max_tokens=100,
+            temperature=0,
+            messages=[{"role": "user", "content": prompt}],
+        )
+
+        command = _message_text(message).strip()
+        self._cache.set(cache_key, command)
+        return command
+
+    async def aget_command(self, description: str) -> str:
+        """Async variant of get_command, sharing the same response cache"""
+        prompt = self._command_prompt % description
+
+        cache_key = _ResponseCache.key(_COMMAND_MODEL, self.shell.name, prompt)
+        cached = self._cache.get(cache_key)
+        if cached is not None:
+            return cached
+
+        message = await self.async_client.messages.create(
+            model=_COMMAND_MODEL,
             max_tokens=100,
             temperature=0,
             messages=[{"role": "user", "content": prompt}],
         )
 
-        return message.content[0].text.strip()
+        command = _message_text(message).strip()
+        self._cache.set(cache_key, command)
+        return command
+
+    async def ashould_proceed(self, command: str) -> str:
+        """Async variant of should_proceed, sharing the same response cache"""
+        prompt = self._safety_prompt % command
+
+        cache_key = _ResponseCache.key(_SAFETY_MODEL, self.shell.name, prompt)
+        cached = self._cache.get(cache_key)
+        if cached is not None:
+            return cached
+
+        message = await self.async_client.messages.create(
+            model=_SAFETY_MODEL,
+            max_tokens=10,
+            temperature=0,
+            messages=[{"role": "user", "content": prompt}]
+        )
+
+        # An empty response means we learned nothing - ask the user
+        safety = _message_text(message).strip() or "CONFIRM"
+        self._cache.set(cache_key, safety)
+        return safety
 
     def should_proceed(self, command: str) -> str:
         """Check command safety using Claude Haiku"""
-        prompt = f"""As a {self.shell.name} command safety checker, analyze this command and respond with EXACTLY one word:
-        Command: {command}
-        
-        If the command appears safe and reasonable, respond with "PROCEED".
-        If the command looks dangerous, unusual, or potentially destructive, respond with "CONFIRM".
-        If the command could be catastrophic or requires human review, respond with "STOP".
-        
-        One word response:"""
+        prompt = self._safety_prompt % command
+
+        cache_key = _ResponseCache.key(_SAFETY_MODEL, self.shell.name, prompt)
+        cached = self._cache.get(cache_key)
+        if cached is not None:
+            return cached
 
         message = self.client.messages.create(
-            model="claude-3-haiku-20240307", 
-            max_tokens=10, 
-            temperature=0, 
+            model=_SAFETY_MODEL,
+            max_tokens=10,
+            temperature=0,
             messages=[{"role": "user", "content": prompt}]
         )
 
-        return message.content[0].text.strip() if len(message.content) > 0 else message.content.text
+        # An empty response means we learned nothing - ask the user
+        safety = _message_text(message).strip() or "CONFIRM"
+        self._cache.set(cache_key, safety)
+        return safety
@@ -1,41 +1,78 @@
+import os
+import sys
 import logging
 import click
 
 
-class ColoredLogger(logging.Logger):
-    """Custom logger that uses Click colors for output"""
+class ColorFormatter(logging.Formatter):
+    """Formatter that prepends a level icon and applies Click colors"""
 
-    COLORS = {
-        logging.DEBUG: dict(fg="blue"),
-        logging.INFO: dict(fg="green"),
-        logging.WARNING: dict(fg="yellow"),
-        logging.ERROR: dict(fg="red"),
-        logging.CRITICAL: dict(fg="red", bold=True),
-    }
+    # (icon, click.style kwargs) indexed by level // 10: DEBUG=1 .. CRITICAL=5
+    STYLES = (
+        None,
+        ("🔍", dict(fg="blue")),
+        ("ℹ️ ", dict(fg="green")),
+        ("⚠️ ", dict(fg="yellow")),
+        ("❌", dict(fg="red")),
+        ("☠️ ", dict(fg="red", bold=True)),
+    )
 
-    ICONS = {
-        logging.DEBUG: "🔍",
-        logging.INFO: "ℹ️ ",
-        logging.WARNING: "⚠️ ",
-        logging.ERROR: "❌",
-        logging.CRITICAL: "☠️ ",
-    }
+    _RESET = "\x1b[0m"
 
-    def __init__(self, name: str):
-        super().__init__(name)
-        self._previous_level = self.level
+    def __init__(self, use_color: bool = True):
+        super().__init__()
+        # Styling is a pure function of the level, so build the prefix for
+        # each level once instead of calling click.style on every record.
+        # Without color (piped output, NO_COLOR) keep the icon but skip the
+        # ANSI escapes entirely.
+        prefixes = [None]
+        for icon, color_kwargs in self.STYLES[1:]:
+            if use_color:
+                prefixes.append(click.style(f"{icon} ", **color_kwargs, reset=False))
+            else:
+                prefixes.append(f"{icon} ")
+        self._prefixes = tuple(prefixes)
+        self._reset = self._RESET if use_color else ""
 
-    def _log(self, level: int, msg: str, *args, **kwargs):
-        if self.isEnabledFor(level):
-            icon = self.ICONS.get(level, "")
-            color_kwargs = self.COLORS.get(level, {})
-            click.secho(f"{icon} {msg}", **color_kwargs)
+    def format(self, record: logging.LogRecord) -> str:
+        index = record.levelno // 10
+        prefix = self._prefixes[index] if 0 < index < len(self._prefixes) else None
+        if prefix is None:
+            return record.getMessage()
+        return prefix + record.getMessage() + self._reset
+
+
+class ColorHandler(logging.StreamHandler):
+    """Stream handler that writes colored records to stdout
+
+    DEBUG/INFO records are left in the stream buffer to avoid a write+flush
+    per line on verbose runs; WARNING and above flush immediately so users
+    see problems right away. logging.shutdown() flushes whatever remains
+    at interpreter exit.
+    """
+
+    def __init__(self):
+        super().__init__(sys.stdout)
+
+    def emit(self, record: logging.LogRecord):
+        try:
+            self.stream.write(self.format(record) + self.terminator)
+            if record.levelno >= logging.WARNING:
+                self.flush()
+        except Exception:
+            self.handleError(record)
 
 
 def setup_logging(debug: bool = False):
-    """Configure the custom logger"""
-    logging.setLoggerClass(ColoredLogger)
+    """Configure the claude-cli logger with colored output"""
     logger = logging.getLogger("claude-cli")
     logger.setLevel(logging.DEBUG if debug else logging.INFO)
 
+    if not logger.handlers:
+        use_color = sys.stdout.isatty() and os.environ.get("NO_COLOR") is None
+        handler = ColorHandler()
+        handler.setFormatter(ColorFormatter(use_color=use_color))
+        logger.addHandler(handler)
+    logger.propagate = False
+
     return logger